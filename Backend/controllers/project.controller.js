@@ -356,6 +356,9 @@ const getProjectReports = async (req, res, next) => {
       },
       orderBy: {
         createdAt: 'desc'
+      },
+      omit: {
+        workerState: true
       }
     });
     
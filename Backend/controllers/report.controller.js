@@ -4,13 +4,54 @@ const { publishClashDetectionJob } = require('../services/queue.service');
 
 const prisma = getPrismaClient();
 
+// Clash rows read per query while a report download is streamed
+const DOWNLOAD_BATCH_SIZE = 1000;
+
+/**
+ * Write the clash records of a report as a JSON array, in clash order.
+ * Rows are read in batches so a large report is never held in memory.
+ * Reports from before the clashes table keep the records in their clashes_data column.
+ * @param {object} res - Response the array is written to
+ * @param {object} report - Report with id and clashesData
+ */
+const writeClashes = async (res, report) => {
+  let first = true;
+  const writeRecords = (records) => {
+    for (const record of records) {
+      res.write((first ? '' : ',') + JSON.stringify(record));
+      first = false;
+    }
+  };
+  
+  res.write('[');
+  if (Array.isArray(report.clashesData)) {
+    writeRecords(report.clashesData);
+  } else {
+    let lastClashId = 0;
+    for (;;) {
+      const rows = await prisma.clash.findMany({
+        where: { reportId: report.id, clashId: { gt: lastClashId } },
+        orderBy: { clashId: 'asc' },
+        take: DOWNLOAD_BATCH_SIZE,
+        select: { clashId: true, data: true }
+      });
+      writeRecords(rows.map(row => row.data));
+      if (rows.length < DOWNLOAD_BATCH_SIZE) {
+        break;
+      }
+      lastClashId = rows[rows.length - 1].clashId;
+    }
+  }
+  res.write(']');
+};
+
 /**
  * Generate clash detection report
  * POST /api/reports/generate
  */
 const generateReport = async (req, res, next) => {
   try {
-    const { projectId, fileIds, settings } = req.body;
+    const { projectId, fileIds, settings, baselineReportId } = req.body;
     
     // Verify project exists and user owns it
     const project = await prisma.project.findUnique({
@@ -42,6 +83,21 @@ const generateReport = async (req, res, next) => {
       throw new AppError('All files must be converted before generating clash report', 400);
     }
     
+    // Optional baseline: clashes between models unchanged since that report are reused
+    if (baselineReportId) {
+      const baseline = await prisma.clashReport.findUnique({
+        where: { id: baselineReportId }
+      });
+      
+      if (!baseline || baseline.projectId !== projectId) {
+        throw new AppError('Baseline report not found', 404);
+      }
+      
+      if (baseline.status !== 'completed') {
+        throw new AppError('Baseline report must be completed', 400);
+      }
+    }
+    
     // Create clash report record
     const report = await prisma.clashReport.create({
       data: {
@@ -63,7 +119,8 @@ const generateReport = async (req, res, next) => {
       projectId,
       userId: req.userId,
       fileIds,
-      settings: settings || {}
+      settings: settings || {},
+      baselineReportId: baselineReportId || null
     });
     
     res.status(201).json({
@@ -106,6 +163,7 @@ const getProjectReports = async (req, res, next) => {
       throw new AppError('Access denied', 403);
     }
     
+    // Summaries only, clash records come from GET /api/reports/:reportId or /:reportId/clashes
     const reports = await prisma.clashReport.findMany({
       where: { projectId },
       orderBy: { createdAt: 'desc' },
@@ -117,7 +175,6 @@ const getProjectReports = async (req, res, next) => {
         criticalClashes: true,
         majorClashes: true,
         minorClashes: true,
-        clashesData: true,
         createdAt: true,
         updatedAt: true
       }
@@ -145,7 +202,9 @@ const getReportById = async (req, res, next) => {
     const { reportId } = req.params;
     
     const report = await prisma.clashReport.findUnique({
-      where: { id: reportId }
+      where: { id: reportId },
+      // Clash records are served paged by GET /api/reports/:reportId/clashes
+      omit: { workerState: true, clashesData: true }
     });
     
     if (!report) {
@@ -179,7 +238,8 @@ const downloadReport = async (req, res, next) => {
     const { format = 'json' } = req.query;
     
     const report = await prisma.clashReport.findUnique({
-      where: { id: reportId }
+      where: { id: reportId },
+      omit: { workerState: true }
     });
     
     if (!report) {
@@ -201,7 +261,8 @@ const downloadReport = async (req, res, next) => {
       res.setHeader('Content-Type', 'application/json');
       res.setHeader('Content-Disposition', `attachment; filename="clash-report-${reportId}.json"`);
       
-      res.status(200).json({
+      // Same document as before, with the clashes array streamed last
+      const header = JSON.stringify({
         reportId: report.id,
         projectId: report.projectId,
         fileIds: report.fileIds,
@@ -211,15 +272,24 @@ const downloadReport = async (req, res, next) => {
           majorClashes: report.majorClashes,
           minorClashes: report.minorClashes
         },
-        clashes: report.clashesData,
         settings: report.settings,
         generatedAt: report.updatedAt
       });
+      
+      res.status(200);
+      res.write(header.slice(0, -1) + ',"clashes":');
+      await writeClashes(res, report);
+      res.end('}');
     } else {
       throw new AppError('Unsupported format. Use format=json', 400);
     }
     
   } catch (error) {
+    if (res.headersSent) {
+      // Part of the document was already sent, a JSON error would corrupt it
+      res.destroy(error);
+      return;
+    }
     next(error);
   }
 };
@@ -263,14 +333,17 @@ const deleteReport = async (req, res, next) => {
 /**
  * Get paginated clashes from report
  * GET /api/reports/:reportId/clashes
+ * Query: page, limit, severity (comma-separated), category, fileId
  */
 const getReportClashes = async (req, res, next) => {
   try {
     const { reportId } = req.params;
-    const { page = 1, limit = 50, severity, status } = req.query;
+    const { severity, category, fileId } = req.query;
+    const { page, limit } = req.pagination;  // Validated by validatePagination
     
     const report = await prisma.clashReport.findUnique({
-      where: { id: reportId }
+      where: { id: reportId },
+      select: { id: true, userId: true, clashesData: true }
     });
     
     if (!report) {
@@ -281,18 +354,61 @@ const getReportClashes = async (req, res, next) => {
       throw new AppError('Access denied', 403);
     }
     
-    // TODO: Implement pagination and filtering from clashesData JSONB
+    const severities = severity ? severity.split(',') : null;
+    
+    let clashes;
+    let total;
+    
+    if (Array.isArray(report.clashesData)) {
+      // Report from before the clashes table, filter its clashes_data in memory
+      const matching = report.clashesData.filter(clash =>
+        (!severities || severities.includes(clash.severity)) &&
+        (!category || clash.object1?.category === category || clash.object2?.category === category) &&
+        (!fileId || clash.object1?.file_id === fileId || clash.object2?.file_id === fileId)
+      );
+      total = matching.length;
+      clashes = matching.slice((page - 1) * limit, page * limit);
+    } else {
+      // Filters on the indexed columns, either side of the pair matches category and fileId
+      const where = { reportId };
+      const conditions = [];
+      if (severities) {
+        where.severity = { in: severities };
+      }
+      if (category) {
+        conditions.push({ OR: [{ category1: category }, { category2: category }] });
+      }
+      if (fileId) {
+        conditions.push({ OR: [{ file1Id: fileId }, { file2Id: fileId }] });
+      }
+      if (conditions.length > 0) {
+        where.AND = conditions;
+      }
+      
+      const [rows, count] = await prisma.$transaction([
+        prisma.clash.findMany({
+          where,
+          orderBy: { clashId: 'asc' },
+          skip: (page - 1) * limit,
+          take: limit,
+          select: { data: true }
+        }),
+        prisma.clash.count({ where })
+      ]);
+      clashes = rows.map(row => row.data);
+      total = count;
+    }
     
     res.status(200).json({
       success: true,
       data: {
-        clashes: [],
+        clashes,
         pagination: {
-          page: parseInt(page),
-          limit: parseInt(limit),
-          total: 0
-        },
-        message: 'Clash pagination not implemented yet'
+          page,
+          limit,
+          total,
+          totalPages: Math.ceil(total / limit)
+        }
       }
     });
     
@@ -313,6 +429,7 @@ const getReportStatistics = async (req, res, next) => {
       where: { id: reportId },
       select: {
         id: true,
+        userId: true,
         totalClashes: true,
         criticalClashes: true,
         majorClashes: true,
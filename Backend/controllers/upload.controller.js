@@ -12,7 +12,7 @@ const prisma = getPrismaClient();
  */
 const uploadFiles = async (req, res, next) => {
   try {
-    const { projectId } = req.body;
+    const { projectId, previousFileId } = req.body;
     const files = req.files;
     
     if (!files || files.length === 0) {
@@ -32,6 +32,21 @@ const uploadFiles = async (req, res, next) => {
       throw new AppError('Access denied. You do not own this project.', 403);
     }
     
+    // Optional lineage: the upload is a new version of this file of the project
+    if (previousFileId) {
+      if (files.length !== 1) {
+        throw new AppError('previousFileId can only be given when uploading a single file', 400);
+      }
+      
+      const previousFile = await prisma.bIMFile.findUnique({
+        where: { id: previousFileId }
+      });
+      
+      if (!previousFile || previousFile.projectId !== projectId) {
+        throw new AppError('Previous file not found', 404);
+      }
+    }
+    
     // Create temporary uploads directory
     const uploadsDir = path.join(__dirname, '../uploads/temp');
     await fs.mkdir(uploadsDir, { recursive: true });
@@ -59,7 +74,8 @@ const uploadFiles = async (req, res, next) => {
           storagePath: tempPath, // Temporary path
           status: 'pending',
           progress: 0,
-          statusMessage: 'Queued for conversion'
+          statusMessage: 'Queued for conversion',
+          previousFileId: previousFileId || null
         }
       });
       
@@ -70,7 +86,9 @@ const uploadFiles = async (req, res, next) => {
         projectId,
         userId: req.userId,
         tempPath,
-        originalName: file.originalname
+        originalName: file.originalname,
+        fileSize: file.size,
+        previousFileId: previousFileId || null
       });
       
       // Convert BigInt fields to strings for JSON serialization
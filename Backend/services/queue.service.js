@@ -8,6 +8,7 @@ let channel = null;
  */
 const QUEUES = {
   CONVERSION: 'bim.conversion',      // IFC to GLB conversion jobs
+  CONVERSION_LARGE: 'bim.conversion.large',  // Conversions of large IFCs, own worker pool
   CLASH_DETECTION: 'bim.clash-detection',      // Clash detection jobs
   CLEANUP: 'bim.cleanup'             // Cleanup jobs (delete old files)
 };
@@ -20,6 +21,12 @@ const EXCHANGES = {
   TOPIC: 'bim.topic'                 // Topic-based routing
 };
 
+/**
+ * IFCs at least this large are converted from QUEUES.CONVERSION_LARGE,
+ * so they never hold up small uploads queued behind them
+ */
+const LARGE_CONVERSION_BYTES = (parseFloat(process.env.CONVERSION_LARGE_FILE_MB) || 200) * 1024 * 1024;
+
 /**
  * Connect to RabbitMQ
  */
@@ -89,11 +96,16 @@ const publishConversionJob = async (job) => {
       userId: job.userId,
       tempPath: job.tempPath,
       originalName: job.originalName,
+      fileSize: job.fileSize || null,
+      previousFileId: job.previousFileId || null,
       timestamp: new Date().toISOString()
     };
     
+    // Route by size class, the worker also moves oversized jobs it finds on the small queue
+    const queue = job.fileSize >= LARGE_CONVERSION_BYTES ? QUEUES.CONVERSION_LARGE : QUEUES.CONVERSION;
+    
     const sent = ch.sendToQueue(
-      QUEUES.CONVERSION,
+      queue,
       Buffer.from(JSON.stringify(message)),
       {
         persistent: true,
@@ -103,7 +115,7 @@ const publishConversionJob = async (job) => {
     );
     
     if (sent) {
-      console.log(`Published conversion job to queue: ${job.fileId}`);
+      console.log(`Published conversion job to ${queue}: ${job.fileId}`);
       return true;
     } else {
       console.error('Failed to publish conversion job (queue full?)');
@@ -131,6 +143,7 @@ const publishClashDetectionJob = async (job) => {
       userId: job.userId,
       fileIds: job.fileIds,
       settings: job.settings || {},
+      baselineReportId: job.baselineReportId || null,
       timestamp: new Date().toISOString()
     };
     
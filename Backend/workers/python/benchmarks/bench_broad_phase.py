@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Benchmark: clash broad phase
+Compares the vectorized grid join (find_overlapping_pairs) with the Python
+AABB/BVHNode classes it replaced, on random element boxes (plus a few
+slab-sized ones) split evenly between two categories.
+
+Usage: python benchmarks/bench_broad_phase.py [--sizes 10000,100000,1000000]
+                                              [--clearance 0.05] [--legacy-limit 100000]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+from clash_detection import find_overlapping_pairs
+
+# ============================================================================
+# LEGACY BROAD PHASE (as used by clash_detection.py before the grid)
+# ============================================================================
+
+class AABB:
+    """Axis-Aligned Bounding Box"""
+    def __init__(self, min_point, max_point):
+        self.min = np.array(min_point)
+        self.max = np.array(max_point)
+
+    def intersects(self, other, clearance=0.0):
+        """Check if this AABB intersects another with clearance"""
+        return (
+            self.min[0] - clearance <= other.max[0] and
+            self.max[0] + clearance >= other.min[0] and
+            self.min[1] - clearance <= other.max[1] and
+            self.max[1] + clearance >= other.min[1] and
+            self.min[2] - clearance <= other.max[2] and
+            self.max[2] + clearance >= other.min[2]
+        )
+
+    def center(self):
+        """Get center point of AABB"""
+        return (self.min + self.max) / 2
+
+class BVHNode:
+    """BVH Node for spatial partitioning"""
+    def __init__(self, objects=None, aabb=None):
+        self.objects = objects or []
+        self.aabb = aabb
+        self.left = None
+        self.right = None
+        self.is_leaf = True
+
+    @classmethod
+    def build(cls, objects, max_objects_per_node=10):
+        """Build BVH tree from list of objects with AABBs"""
+        if not objects:
+            return None
+
+        all_mins = [obj['aabb'].min for obj in objects]
+        all_maxs = [obj['aabb'].max for obj in objects]
+        combined_min = np.min(all_mins, axis=0)
+        combined_max = np.max(all_maxs, axis=0)
+        node = cls(objects, AABB(combined_min, combined_max))
+
+        if len(objects) <= max_objects_per_node:
+            return node
+
+        split_axis = np.argmax(combined_max - combined_min)
+        sorted_objects = sorted(objects, key=lambda obj: obj['aabb'].center()[split_axis])
+        mid = len(sorted_objects) // 2
+
+        node.is_leaf = False
+        node.left = cls.build(sorted_objects[:mid], max_objects_per_node)
+        node.right = cls.build(sorted_objects[mid:], max_objects_per_node)
+        node.objects = []
+
+        return node
+
+    def query(self, test_aabb, clearance=0.0):
+        """Query BVH for objects whose AABB intersects test_aabb"""
+        if not self.aabb.intersects(test_aabb, clearance):
+            return []
+
+        if self.is_leaf:
+            return [obj for obj in self.objects if obj['aabb'].intersects(test_aabb, clearance)]
+
+        results = []
+        if self.left:
+            results.extend(self.left.query(test_aabb, clearance))
+        if self.right:
+            results.extend(self.right.query(test_aabb, clearance))
+
+        return results
+
+def legacy_pairs(bounds1, bounds2, clearance):
+    objects1 = [{'index': i, 'aabb': AABB(b[0], b[1])} for i, b in enumerate(bounds1)]
+    objects2 = [{'index': j, 'aabb': AABB(b[0], b[1])} for j, b in enumerate(bounds2)]
+    tree = BVHNode.build(objects2)
+    pairs = []
+    for obj1 in objects1:
+        for obj2 in tree.query(obj1['aabb'], clearance):
+            pairs.append((obj1['index'], obj2['index']))
+    return pairs
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def random_bounds(count, rng):
+    """Element-sized boxes (10 cm - 1.5 m) at roughly constant density, 0.1% slabs"""
+    side = 2.0 * count ** (1.0 / 3.0)
+    mins = rng.uniform(0.0, side, size=(count, 3))
+    sizes = rng.uniform(0.1, 1.5, size=(count, 3))
+    slabs = rng.random(count) < 0.001
+    sizes[slabs, :2] = rng.uniform(0.25, 0.5, size=(int(slabs.sum()), 2)) * side
+    sizes[slabs, 2] = 0.3
+    return np.ascontiguousarray(np.stack((mins, mins + sizes), axis=1))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--clearance', type=float, default=0.05)
+    parser.add_argument('--legacy-limit', type=int, default=100000,
+                        help='skip the BVHNode baseline above this many boxes')
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'boxes':>9} {'pairs':>10} {'grid':>9} {'BVHNode':>9} {'speedup':>8}  match")
+
+    for size in (int(s) for s in args.sizes.split(',')):
+        bounds1 = random_bounds(size // 2, rng)
+        bounds2 = random_bounds(size - size // 2, rng)
+
+        start = time.perf_counter()
+        pairs = find_overlapping_pairs(bounds1, bounds2, args.clearance)
+        grid_time = time.perf_counter() - start
+
+        if size <= args.legacy_limit:
+            start = time.perf_counter()
+            legacy = legacy_pairs(bounds1, bounds2, args.clearance)
+            legacy_time = time.perf_counter() - start
+            match = set(map(tuple, pairs.tolist())) == set(legacy) and len(pairs) == len(legacy)
+            print(f"{size:>9} {len(pairs):>10} {grid_time:>8.3f}s {legacy_time:>8.2f}s "
+                  f"{legacy_time / max(grid_time, 1e-9):>7.0f}x  {'yes' if match else 'NO'}")
+        else:
+            print(f"{size:>9} {len(pairs):>10} {grid_time:>8.3f}s {'skipped':>9} {'':>8}  -")
+
+if __name__ == '__main__':
+    main()
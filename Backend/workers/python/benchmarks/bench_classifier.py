@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Benchmark: element classification
+Compares convert.classify (combined keyword regex + class dict, memoized)
+with the nested keyword loops it replaced, on Revit-style element names
+built from a limited set of type names, and checks every category matches.
+
+Usage: python benchmarks/bench_classifier.py [--elements 200000] [--types 2000]
+                                             [--ifc model.ifc]
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from convert import KEYWORDS, STRUCTURAL_CLASSES, classify, keyword_category
+
+# ============================================================================
+# LEGACY CLASSIFIER (as used by convert.get_category before the regex)
+# ============================================================================
+
+def legacy_classify(name, obj_type, entity_type):
+    full_text = f"{name.lower()} {obj_type.lower()}"
+    for cat, words in KEYWORDS.items():
+        for word in words:
+            if word in full_text:
+                return cat
+    for cat, classes in STRUCTURAL_CLASSES.items():
+        if entity_type in classes:
+            return cat
+    return "others"
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+FILLER = ["Basic", "Generic", "Standard", "Type", "mm", "Level", "Exterior", "Interior", "Copper", "Steel", "Timber"]
+ENTITIES = [ifc_class for classes in STRUCTURAL_CLASSES.values() for ifc_class in classes] + [
+    "IfcFlowSegment", "IfcFlowFitting", "IfcBuildingElementProxy", "IfcPlate", "IfcMember"]
+
+def random_triples(elements, types, rng):
+    """(Name, ObjectType, entity) per element, Revit style: 'Family:Type:ElementId'"""
+    vocabulary = [word for words in KEYWORDS.values() for word in words] + FILLER * 4
+    type_names = []
+    for _ in range(types):
+        words = rng.sample(vocabulary, rng.randint(1, 3))
+        family = " ".join(word.title() if rng.random() < 0.5 else word for word in words)
+        type_names.append((f"{family}:{rng.randint(50, 600)}mm", rng.choice(ENTITIES)))
+    triples = []
+    for element_id in range(elements):
+        type_name, entity = rng.choice(type_names)
+        triples.append((f"{type_name}:{100000 + element_id}", type_name, entity))
+    return triples
+
+def timed(func, triples):
+    start = time.perf_counter()
+    result = [func(*triple) for triple in triples]
+    return time.perf_counter() - start, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--elements', type=int, default=200000)
+    parser.add_argument('--types', type=int, default=2000)
+    parser.add_argument('--ifc', help='also classify the products of this model')
+    args = parser.parse_args()
+
+    triples = random_triples(args.elements, args.types, random.Random(42))
+    # Same elements classified by their type name alone
+    uniform = [("", obj_type, entity) for _, obj_type, entity in triples]
+    datasets = [('names', triples), ('type names', uniform)]
+
+    if args.ifc:
+        import ifcopenshell
+        model = ifcopenshell.open(args.ifc)
+        datasets.append((os.path.basename(args.ifc), [
+            (product.Name or "", product.ObjectType or "", product.is_a())
+            for product in model.by_type("IfcProduct")]))
+
+    print(f"{'dataset':>12} {'elements':>9} {'loops':>8} {'regex':>8} {'speedup':>8}  match")
+    for label, data in datasets:
+        keyword_category.cache_clear()
+        legacy_time, legacy = timed(legacy_classify, data)
+        new_time, result = timed(classify, data)
+        print(f"{label:>12} {len(data):>9} {legacy_time:>7.3f}s {new_time:>7.3f}s "
+              f"{legacy_time / max(new_time, 1e-9):>7.1f}x  {'yes' if result == legacy else 'NO'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: IFC metadata extraction
+Compares extract_element_metadata (relationships indexed once each) with the
+per-product walk over IsDefinedBy / HasAssociations / ContainedInStructure it
+replaced, and checks both produce the same metadata. Run it on the largest
+model you have at hand.
+
+Usage: python benchmarks/bench_metadata.py model.ifc [--runs 3]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import ifcopenshell
+from convert import KEYWORDS, get_category, extract_element_metadata
+
+# ============================================================================
+# LEGACY EXTRACTION (as used by convert.py STEP 1 before the relationship index)
+# ============================================================================
+
+def legacy_element_metadata(model):
+    buckets = {key: [] for key in list(KEYWORDS.keys()) + ["others"]}
+    metadata_export = {key: {} for key in buckets.keys()}
+
+    for product in model.by_type("IfcProduct"):
+        if product.is_a("IfcSpatialStructureElement") or product.is_a("IfcOpeningElement"):
+            continue
+
+        cat = get_category(product)
+        buckets[cat].append(product.GlobalId)
+
+        element_data = {
+            "GlobalId": product.GlobalId,
+            "Name": product.Name or "",
+            "IfcType": product.is_a(),
+            "Category": cat,
+            "Description": getattr(product, 'Description', None) or "",
+            "Tag": getattr(product, 'Tag', None) or "",
+            "ObjectType": getattr(product, 'ObjectType', None) or ""
+        }
+
+        try:
+            if hasattr(product, 'IsDefinedBy'):
+                properties = {}
+                for definition in product.IsDefinedBy:
+                    if definition.is_a('IfcRelDefinesByProperties'):
+                        property_set = definition.RelatingPropertyDefinition
+                        if property_set.is_a('IfcPropertySet'):
+                            for prop in property_set.HasProperties:
+                                if prop.is_a('IfcPropertySingleValue'):
+                                    if prop.NominalValue:
+                                        properties[prop.Name] = str(prop.NominalValue.wrappedValue)
+                if properties:
+                    element_data["Properties"] = properties
+        except Exception:
+            pass
+
+        try:
+            if hasattr(product, 'HasAssociations'):
+                for association in product.HasAssociations:
+                    if association.is_a('IfcRelAssociatesMaterial'):
+                        material = association.RelatingMaterial
+                        if material.is_a('IfcMaterial'):
+                            element_data["Material"] = material.Name
+                        elif material.is_a('IfcMaterialLayerSetUsage'):
+                            layer_set = material.ForLayerSet
+                            if layer_set:
+                                materials = [layer.Material.Name for layer in layer_set.MaterialLayers if layer.Material]
+                                element_data["Material"] = ", ".join(materials)
+        except Exception:
+            pass
+
+        try:
+            if hasattr(product, 'ContainedInStructure'):
+                for rel in product.ContainedInStructure:
+                    structure = rel.RelatingStructure
+                    if structure.is_a('IfcBuildingStorey'):
+                        element_data["Level"] = structure.Name or structure.LongName or ""
+                        break
+        except Exception:
+            pass
+
+        metadata_export[cat][product.GlobalId] = element_data
+
+    return buckets, metadata_export
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def best_of(runs, func, model):
+    best, result = None, None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func(model)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('ifc_path')
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    model = ifcopenshell.open(args.ifc_path)
+    print(f"Opened {args.ifc_path} in {time.perf_counter() - start:.2f}s")
+    print(f"   products: {len(model.by_type('IfcProduct'))}, "
+          f"property rels: {len(model.by_type('IfcRelDefinesByProperties'))}, "
+          f"material rels: {len(model.by_type('IfcRelAssociatesMaterial'))}, "
+          f"containment rels: {len(model.by_type('IfcRelContainedInSpatialStructure'))}")
+
+    legacy_time, legacy = best_of(args.runs, legacy_element_metadata, model)
+    batched_time, batched = best_of(args.runs, extract_element_metadata, model)
+
+    elements = sum(len(guids) for guids in batched[0].values())
+    print(f"{'elements':>9} {'per-product':>12} {'batched':>9} {'speedup':>8}  match")
+    print(f"{elements:>9} {legacy_time:>11.3f}s {batched_time:>8.3f}s "
+          f"{legacy_time / max(batched_time, 1e-9):>7.1f}x  {'yes' if batched == legacy else 'NO'}")
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Benchmark: same-category broad phase
+Compares find_self_overlapping_pairs with the previous approach (full
+cross-join of the category with itself, then masking i < j and same-file
+pairs), on random element boxes from two files. Time per candidate should
+stay flat as the box count grows.
+
+Usage: python benchmarks/bench_self_join.py [--sizes 10000,100000,1000000]
+                                            [--clearance 0.05] [--files 2]
+"""
+
+import os
+import sys
+import time
+import argparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+from clash_detection import find_overlapping_pairs, find_self_overlapping_pairs
+from bench_broad_phase import random_bounds
+
+def cross_join_pairs(bounds, clearance, file_ids):
+    """Same-category candidates as computed before the self-join"""
+    candidates = find_overlapping_pairs(bounds, bounds, clearance)
+    candidates = candidates[candidates[:, 0] < candidates[:, 1]]
+    return candidates[file_ids[candidates[:, 0]] != file_ids[candidates[:, 1]]]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='10000,100000,1000000')
+    parser.add_argument('--clearance', type=float, default=0.05)
+    parser.add_argument('--files', type=int, default=2)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    print(f"{'boxes':>9} {'pairs':>10} {'self-join':>10} {'ns/pair':>8} {'cross-join':>11} {'ns/pair':>8}  match")
+
+    for size in (int(s) for s in args.sizes.split(',')):
+        bounds = random_bounds(size, rng)
+        groups = rng.integers(0, args.files, size=size)
+        file_ids = np.array([f"file-{group}" for group in groups], dtype=object)
+
+        start = time.perf_counter()
+        pairs = find_self_overlapping_pairs(bounds, args.clearance, groups)
+        self_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        legacy = cross_join_pairs(bounds, args.clearance, file_ids)
+        cross_time = time.perf_counter() - start
+
+        match = np.array_equal(pairs, legacy)
+        per_pair = 1e9 / max(len(pairs), 1)
+        print(f"{size:>9} {len(pairs):>10} {self_time:>9.3f}s {self_time * per_pair:>8.0f} "
+              f"{cross_time:>10.3f}s {cross_time * per_pair:>8.0f}  {'yes' if match else 'NO'}")
+
+if __name__ == '__main__':
+    main()
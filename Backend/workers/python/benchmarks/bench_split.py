@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-category IFC splitting
+Compares the legacy re-open/remove loop with the single-pass splitter
+
+Usage: python benchmarks/bench_split.py model1.ifc [model2.ifc ...]
+"""
+
+import os
+import sys
+import time
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import ifcopenshell
+from convert import (
+    KEYWORDS,
+    get_category,
+    split_categories_legacy,
+    split_categories_single_pass
+)
+
+def build_buckets(model):
+    """Same bucketing as STEP 1 of process_conversion_job"""
+    buckets = {key: [] for key in list(KEYWORDS.keys()) + ["others"]}
+    for product in model.by_type("IfcProduct"):
+        if product.is_a("IfcSpatialStructureElement") or product.is_a("IfcOpeningElement"):
+            continue
+        buckets[get_category(product)].append(product.GlobalId)
+    return buckets
+
+def run_splitter(subsets):
+    """Drain a splitter generator, returning {category: (path, seconds)}"""
+    results = {}
+    start = time.perf_counter()
+    for cat, path in subsets:
+        now = time.perf_counter()
+        results[cat] = (path, now - start)
+        start = now
+    return results
+
+def subset_guids(path):
+    """GlobalIds of all non-opening elements in a subset file"""
+    subset = ifcopenshell.open(path)
+    return {
+        ele.GlobalId for ele in subset.by_type("IfcElement")
+        if not ele.is_a("IfcOpeningElement")
+    }
+
+def benchmark(ifc_path):
+    size_mb = os.path.getsize(ifc_path) / (1024 * 1024)
+    print(f"\n{'='*60}")
+    print(f"{os.path.basename(ifc_path)} ({size_mb:.1f} MB)")
+    print(f"{'='*60}")
+
+    start = time.perf_counter()
+    model = ifcopenshell.open(ifc_path)
+    parse_time = time.perf_counter() - start
+    buckets = build_buckets(model)
+    categories = [cat for cat, guids in buckets.items() if guids]
+    print(f"Parse: {parse_time:.2f}s, {len(categories)} non-empty categories")
+
+    legacy_dir = tempfile.mkdtemp(prefix='bench_split_legacy_')
+    single_dir = tempfile.mkdtemp(prefix='bench_split_single_')
+    try:
+        start = time.perf_counter()
+        legacy = run_splitter(split_categories_legacy(ifc_path, buckets, legacy_dir))
+        legacy_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        single = run_splitter(split_categories_single_pass(model, buckets, single_dir))
+        single_time = time.perf_counter() - start
+
+        print(f"\n   {'category':<12} {'elements':>9} {'legacy':>9} {'single':>9}  match")
+        for cat in categories:
+            legacy_path, legacy_cat_time = legacy[cat]
+            single_path, single_cat_time = single[cat]
+            match = subset_guids(legacy_path) == subset_guids(single_path)
+            print(f"   {cat:<12} {len(buckets[cat]):>9} {legacy_cat_time:>8.2f}s {single_cat_time:>8.2f}s  {'yes' if match else 'NO'}")
+
+        print(f"\n   Legacy loop:  {legacy_time:.2f}s")
+        print(f"   Single pass:  {single_time:.2f}s (+{parse_time:.2f}s shared parse)")
+        print(f"   Speedup:      {legacy_time / max(single_time, 1e-9):.1f}x")
+    finally:
+        shutil.rmtree(legacy_dir, ignore_errors=True)
+        shutil.rmtree(single_dir, ignore_errors=True)
+
+if __name__ == '__main__':
+    if len(sys.argv) < 2:
+        print(__doc__)
+        sys.exit(1)
+    for path in sys.argv[1:]:
+        benchmark(path)
@@ -0,0 +1,170 @@
+"""
+In-memory stand-ins for MinIO and the clash_reports/clashes tables.
+"""
+
+import copy
+import io
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from minio.error import S3Error
+
+class MemoryResponse:
+    def __init__(self, data):
+        self.data = data
+
+    def read(self):
+        return self.data
+
+    def close(self):
+        pass
+
+    def release_conn(self):
+        pass
+
+class MemoryMinio:
+    """The MinIO calls of the workers on a dict, every write one second after the previous one"""
+    def __init__(self):
+        self.objects = {}
+        self.modified = {}
+        self.clock = datetime.now(timezone.utc)
+
+    def _set(self, name, data):
+        self.clock += timedelta(seconds=1)
+        self.objects[name] = data
+        self.modified[name] = self.clock
+
+    def _missing(self, name):
+        return S3Error(None, 'NoSuchKey', 'Object does not exist', name, '', '')
+
+    def put_object(self, bucket, name, data, length, **kwargs):
+        self._set(name, data.read())
+
+    def fput_object(self, bucket, name, path, **kwargs):
+        with open(path, 'rb') as f:
+            self._set(name, f.read())
+
+    def get_object(self, bucket, name):
+        if name not in self.objects:
+            raise self._missing(name)
+        return MemoryResponse(self.objects[name])
+
+    def fget_object(self, bucket, name, path):
+        if name not in self.objects:
+            raise self._missing(name)
+        with open(path, 'wb') as f:
+            f.write(self.objects[name])
+
+    def copy_object(self, bucket, name, source):
+        if source.object_name not in self.objects:
+            raise self._missing(source.object_name)
+        self._set(name, self.objects[source.object_name])
+
+    def list_objects(self, bucket, prefix='', recursive=False):
+        return [
+            SimpleNamespace(object_name=name, size=len(data), last_modified=self.modified[name])
+            for name, data in sorted(self.objects.items()) if name.startswith(prefix)
+        ]
+
+    def remove_object(self, bucket, name):
+        self.objects.pop(name, None)
+        self.modified.pop(name, None)
+
+    def put_json(self, name, data):
+        """Store a JSON object"""
+        payload = json.dumps(data).encode('utf-8')
+        self.put_object(None, name, io.BytesIO(payload), len(payload))
+
+class MemoryReportDB:
+    """
+    One clash_reports row and its clashes rows, behind the statements of the
+    clash worker's attempt and checkpoint bookkeeping. Writes of a connection
+    are only visible to others once committed.
+    """
+    def __init__(self, status='processing', worker_state=None, clash_ids=()):
+        self.committed = {'status': status, 'worker_state': worker_state, 'clash_ids': list(clash_ids)}
+
+    def connect(self):
+        return MemoryConnection(self)
+
+class MemoryConnection:
+    def __init__(self, db):
+        self.db = db
+        self.pending = None
+        self.commits = 0
+
+    @property
+    def row(self):
+        return self.pending if self.pending is not None else self.db.committed
+
+    def write(self):
+        if self.pending is None:
+            self.pending = copy.deepcopy(self.db.committed)
+        return self.pending
+
+    def cursor(self):
+        return MemoryCursor(self)
+
+    def commit(self):
+        if self.pending is not None:
+            self.db.committed = self.pending
+            self.pending = None
+        self.commits += 1
+
+    def rollback(self):
+        self.pending = None
+
+class MemoryCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.result = None
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def execute(self, query, values=None):
+        query = ' '.join(query.split())
+        self.result = None
+        if query.startswith('SELECT status, worker_state'):
+            row = self.conn.row
+            self.result = [(row['status'], copy.deepcopy(row['worker_state']), time.time())]
+        elif "'{attempts}'" in query:
+            row = self.conn.write()
+            state = row['worker_state'] = dict(row['worker_state'] or {})
+            state['attempts'] = json.loads(values[0])
+            state['lease'] = json.loads(values[1])
+            self.rowcount = 1
+        elif "worker_state - 'lease'" in query:
+            row = self.conn.write()
+            state = row['worker_state'] or {}
+            self.rowcount = int(state.get('lease', {}).get('owner') == values[1])
+            if self.rowcount:
+                row['worker_state'] = {key: value for key, value in state.items() if key != 'lease'}
+        elif query.startswith('DELETE FROM clashes') and 'clash_id >' in query:
+            row = self.conn.write()
+            row['clash_ids'] = [clash_id for clash_id in row['clash_ids'] if clash_id <= values[1]]
+        elif query.startswith('DELETE FROM clashes'):
+            self.conn.write()['clash_ids'] = []
+        else:
+            raise AssertionError(f"Unexpected statement: {query}")
+
+    def fetchone(self):
+        return self.result[0] if self.result else None
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def minio():
+    return MemoryMinio()
+
+@pytest.fixture
+def report_db():
+    return MemoryReportDB
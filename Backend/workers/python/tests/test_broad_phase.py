@@ -0,0 +1,117 @@
+"""
+Broad phase tests: the grid joins against a brute-force AABB overlap test.
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+import pytest
+import clash_detection
+from clash_detection import find_overlapping_pairs, find_self_overlapping_pairs
+
+def brute_force_pairs(bounds1, bounds2, clearance):
+    """(i, j) whose gap is <= clearance on every axis, sorted"""
+    overlap = (
+        (bounds1[:, None, 0] - clearance <= bounds2[None, :, 1]) &
+        (bounds1[:, None, 1] + clearance >= bounds2[None, :, 0])
+    ).all(axis=2)
+    return np.argwhere(overlap).astype(np.int64)
+
+def random_bounds(rng, count, side=20.0):
+    """Element-sized boxes plus a few slabs spanning most of the model"""
+    mins = rng.uniform(-side / 2, side / 2, size=(count, 3))
+    sizes = rng.uniform(0.05, 1.5, size=(count, 3))
+    slabs = rng.random(count) < 0.02
+    sizes[slabs, :2] = rng.uniform(0.3, 0.9, size=(int(slabs.sum()), 2)) * side
+    return np.ascontiguousarray(np.stack((mins, mins + sizes), axis=1))
+
+def lattice_bounds(rng, count):
+    """
+    Boxes on a 0.25 m lattice, so many share a face, an edge or a corner
+    exactly, or are a clearance apart to the bit; a third are degenerate
+    (points, segments, flat sheets)
+    """
+    mins = rng.integers(0, 24, size=(count, 3)) * 0.25
+    sizes = rng.integers(0, 5, size=(count, 3)) * 0.25
+    degenerate = rng.random(count) < 0.33
+    sizes[degenerate, rng.integers(0, 3, size=int(degenerate.sum()))] = 0.0
+    sizes[rng.random(count) < 0.05] = 0.0
+    return np.ascontiguousarray(np.stack((mins, mins + sizes), axis=1))
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('clearance', [0.0, 0.05, 0.25])
+@pytest.mark.parametrize('make_bounds', [random_bounds, lattice_bounds])
+def test_grid_join_matches_brute_force(seed, clearance, make_bounds):
+    rng = np.random.default_rng(seed)
+    bounds1 = make_bounds(rng, 300)
+    bounds2 = make_bounds(rng, 200)
+
+    pairs = find_overlapping_pairs(bounds1, bounds2, clearance)
+
+    assert pairs.dtype == np.int64
+    np.testing.assert_array_equal(pairs, brute_force_pairs(bounds1, bounds2, clearance))
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('clearance', [0.0, 0.05, 0.25])
+@pytest.mark.parametrize('make_bounds', [random_bounds, lattice_bounds])
+def test_self_join_matches_brute_force(seed, clearance, make_bounds):
+    rng = np.random.default_rng(seed)
+    bounds = make_bounds(rng, 400)
+    groups = rng.integers(0, 6, size=len(bounds))
+
+    expected = brute_force_pairs(bounds, bounds, clearance)
+    expected = expected[expected[:, 0] < expected[:, 1]]
+    np.testing.assert_array_equal(find_self_overlapping_pairs(bounds, clearance), expected)
+
+    in_other_groups = groups[expected[:, 0]] != groups[expected[:, 1]]
+    np.testing.assert_array_equal(
+        find_self_overlapping_pairs(bounds, clearance, groups), expected[in_other_groups]
+    )
+
+@pytest.mark.parametrize('seed', range(3))
+def test_coarse_levels_and_chunks_match_brute_force(seed, monkeypatch):
+    """Tiny limits push most boxes through every coarser grid level and many chunks"""
+    monkeypatch.setattr(clash_detection, 'BROAD_PHASE_MAX_CELLS', 2)
+    monkeypatch.setattr(clash_detection, 'BROAD_PHASE_CHUNK', 64)
+    rng = np.random.default_rng(seed)
+    bounds1 = random_bounds(rng, 300)
+    bounds2 = lattice_bounds(rng, 200)
+
+    np.testing.assert_array_equal(
+        find_overlapping_pairs(bounds1, bounds2, 0.05), brute_force_pairs(bounds1, bounds2, 0.05)
+    )
+    expected = brute_force_pairs(bounds1, bounds1, 0.05)
+    np.testing.assert_array_equal(
+        find_self_overlapping_pairs(bounds1, 0.05), expected[expected[:, 0] < expected[:, 1]]
+    )
+
+def test_touching_boxes_overlap():
+    bounds1 = np.array([[[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]])
+    bounds2 = np.array([
+        [[1.0, 0.0, 0.0], [2.0, 1.0, 1.0]],  # Shared face
+        [[1.0, 1.0, 1.0], [2.0, 2.0, 2.0]],  # Shared corner
+        [[1.5, 0.0, 0.0], [2.0, 1.0, 1.0]]   # 0.5 m gap
+    ])
+
+    np.testing.assert_array_equal(find_overlapping_pairs(bounds1, bounds2), [[0, 0], [0, 1]])
+    np.testing.assert_array_equal(find_overlapping_pairs(bounds1, bounds2, 0.5), [[0, 0], [0, 1], [0, 2]])
+
+def test_degenerate_boxes():
+    """All boxes zero-sized (the median cell size is 0) and identical points"""
+    points = np.array([[[1.0, 2.0, 3.0]] * 2, [[1.0, 2.0, 3.0]] * 2, [[4.0, 2.0, 3.0]] * 2])
+
+    np.testing.assert_array_equal(find_self_overlapping_pairs(points), [[0, 1]])
+    np.testing.assert_array_equal(find_overlapping_pairs(points, points, 3.0), brute_force_pairs(points, points, 3.0))
+
+def test_empty_inputs():
+    boxes = np.array([[[0.0, 0.0, 0.0], [1.0, 1.0, 1.0]]])
+    empty = np.empty((0, 2, 3))
+
+    assert find_overlapping_pairs(empty, boxes).shape == (0, 2)
+    assert find_overlapping_pairs(boxes, empty).shape == (0, 2)
+    assert find_self_overlapping_pairs(boxes).shape == (0, 2)
@@ -0,0 +1,142 @@
+"""
+Clash job bookkeeping tests: attempts and leases, checkpoint restore and
+baseline carry-forward.
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from clash_detection import (
+    CLASH_JOB_LEASE_S, begin_attempt, carry_forward_clashes, checkpoint_inputs,
+    match_baseline_models, model_key, pair_key, release_lease, restore_checkpoint
+)
+
+def attempt(db, owner):
+    conn = db.connect()
+    return begin_attempt(conn, conn.cursor(), 'report', owner)
+
+def test_attempts_are_counted_per_claim(report_db):
+    db = report_db(worker_state={'checkpoint': {'clashes': 3}})
+
+    status, number, checkpoint = attempt(db, 'job1')
+
+    assert (status, number, checkpoint) == ('processing', 1, {'clashes': 3})
+    lease = db.committed['worker_state']['lease']
+    assert lease['owner'] == 'job1'
+    assert lease['expires'] > time.time() + CLASH_JOB_LEASE_S - 60
+
+    # The same job claiming again keeps its lease and counts on
+    assert attempt(db, 'job1')[1] == 2
+
+def test_live_lease_of_another_job_is_not_claimed(report_db):
+    db = report_db(worker_state={'attempts': 1, 'lease': {'owner': 'job1', 'expires': time.time() + 60}})
+
+    assert attempt(db, 'job2') == ('leased', 1, None)
+    assert db.committed['worker_state']['attempts'] == 1
+    assert db.committed['worker_state']['lease']['owner'] == 'job1'
+
+def test_expired_lease_is_taken_over(report_db):
+    db = report_db(worker_state={'attempts': 1, 'lease': {'owner': 'job1', 'expires': time.time() - 1}})
+
+    assert attempt(db, 'job2')[:2] == ('processing', 2)
+    assert db.committed['worker_state']['lease']['owner'] == 'job2'
+
+def test_released_lease_is_claimed_at_once(report_db):
+    db = report_db()
+    attempt(db, 'job1')
+
+    release_lease(db.connect(), 'report', 'job2')  # Not the owner, nothing happens
+    assert attempt(db, 'job3')[0] == 'leased'
+
+    release_lease(db.connect(), 'report', 'job1')
+    assert attempt(db, 'job3')[:2] == ('processing', 2)
+
+def test_completed_report_counts_no_attempt(report_db):
+    db = report_db(status='completed', worker_state={'attempts': 2})
+
+    assert attempt(db, 'job1') == ('completed', 2, None)
+    assert 'lease' not in db.committed['worker_state']
+
+def models(**fingerprints):
+    """{key: model} of file f1, one model per category"""
+    return {
+        model_key('f1', category): {'file_id': 'f1', 'file_name': 'a.ifc', 'category': category, 'fingerprint': fingerprint}
+        for category, fingerprint in fingerprints.items()
+    }
+
+def test_checkpoint_restored_over_the_same_inputs(report_db):
+    inputs = checkpoint_inputs(models(walls='w1', pipes='p1'), None)
+    checkpoint = {'inputs': inputs, 'pairs': [['pipes', 'walls']], 'clashes': 2}
+    db = report_db(clash_ids=[1, 2, 3, 4])
+    conn = db.connect()
+
+    done_pairs, clash_count = restore_checkpoint(conn.cursor(), 'report', checkpoint, inputs)
+    conn.commit()
+
+    assert done_pairs == [pair_key('pipes', 'walls')]
+    assert clash_count == 2
+    # Rows of the pair that was being stored when the attempt died are dropped
+    assert db.committed['clash_ids'] == [1, 2]
+
+def test_checkpoint_dropped_when_inputs_changed(report_db):
+    old_inputs = checkpoint_inputs(models(walls='w1', pipes='p1'), None)
+    checkpoint = {'inputs': old_inputs, 'pairs': [['pipes', 'walls']], 'clashes': 2}
+    db = report_db(clash_ids=[1, 2])
+    conn = db.connect()
+
+    new_inputs = checkpoint_inputs(models(walls='w2', pipes='p1'), None)
+    assert restore_checkpoint(conn.cursor(), 'report', checkpoint, new_inputs) == ([], 0)
+    conn.commit()
+    assert db.committed['clash_ids'] == []
+
+def test_checkpoint_unused_without_fingerprints(report_db):
+    assert checkpoint_inputs(models(walls='w1', pipes=None), None) is None
+
+    checkpoint = {'inputs': None, 'pairs': [['pipes', 'walls']], 'clashes': 1}
+    db = report_db(clash_ids=[1])
+    conn = db.connect()
+    assert restore_checkpoint(conn.cursor(), 'report', checkpoint, None) == ([], 0)
+
+def clash(file1, category1, file2, category2, clash_id=1):
+    return {
+        'clash_id': clash_id, 'severity': 'major',
+        'object1': {'file_id': file1, 'file_name': f'{file1}.ifc', 'category': category1},
+        'object2': {'file_id': file2, 'file_name': f'{file2}.ifc', 'category': category2}
+    }
+
+def test_baseline_models_matched_by_file_or_name():
+    baseline = {
+        model_key('old', 'walls'): {'file_id': 'old', 'file_name': 'a.ifc', 'category': 'walls', 'fingerprint': 'w'},
+        model_key('old', 'pipes'): {'file_id': 'old', 'file_name': 'a.ifc', 'category': 'pipes', 'fingerprint': 'p'},
+        model_key('f2', 'ducts'): {'file_id': 'f2', 'file_name': 'b.ifc', 'category': 'ducts', 'fingerprint': 'd'}
+    }
+    current = models(walls='w', pipes='changed')
+    current[model_key('f2', 'ducts')] = {'file_id': 'f2', 'file_name': 'b.ifc', 'category': 'ducts', 'fingerprint': 'd'}
+
+    assert match_baseline_models(current, baseline) == {
+        # A re-upload of a.ifc matches by name, f2 by its own id; changed pipes never match
+        model_key('f1', 'walls'): model_key('old', 'walls'),
+        model_key('f2', 'ducts'): model_key('f2', 'ducts')
+    }
+
+def test_clashes_carried_forward_between_unchanged_models_only():
+    current = models(walls='w', pipes='p', ducts='d')
+    matches = {model_key('f1', 'walls'): model_key('old', 'walls'), model_key('f1', 'ducts'): model_key('old', 'ducts')}
+    baseline_clashes = [
+        clash('old', 'walls', 'old', 'ducts', 1),
+        clash('old', 'walls', 'old', 'pipes', 2)
+    ]
+
+    carried = carry_forward_clashes(baseline_clashes, matches, current)
+
+    assert list(carried) == [pair_key('walls', 'ducts')]
+    record, = carried[pair_key('walls', 'ducts')]
+    # Re-pointed at the current file, the baseline records are left as they were
+    assert record['object1']['file_id'] == record['object2']['file_id'] == 'f1'
+    assert record['object1']['file_name'] == 'a.ifc'
+    assert baseline_clashes[0]['object1']['file_id'] == 'old'
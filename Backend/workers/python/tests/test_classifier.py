@@ -0,0 +1,74 @@
+"""
+Classifier tests: convert.classify (keyword regex, memoized) against the
+nested keyword loops it replaced.
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import pytest
+from convert import KEYWORDS, STRUCTURAL_CLASSES, classify, keyword_category
+
+def legacy_classify(name, obj_type, entity_type):
+    """convert.get_category before the regex"""
+    full_text = f"{name.lower()} {obj_type.lower()}"
+    for cat, words in KEYWORDS.items():
+        for word in words:
+            if word in full_text:
+                return cat
+    for cat, classes in STRUCTURAL_CLASSES.items():
+        if entity_type in classes:
+            return cat
+    return "others"
+
+WORDS = [word for words in KEYWORDS.values() for word in words]
+ENTITIES = [ifc_class for classes in STRUCTURAL_CLASSES.values() for ifc_class in classes] + [
+    "IfcFlowSegment", "IfcBuildingElementProxy", "IfcPlate", ""]
+NOISE = ["Basic", "Generic", "200mm", ":", "-", "_", "/", " ", "(", "#", "1", "Ä", "ß", "日本", "\t", "\n"]
+
+def random_text(rng):
+    """Keywords, keyword fragments and noise, in random case"""
+    parts = []
+    for _ in range(rng.randint(0, 5)):
+        kind = rng.random()
+        if kind < 0.3:
+            word = rng.choice(WORDS)
+        elif kind < 0.5:
+            # Keyword split apart or cut short, which must not match
+            word = rng.choice(WORDS)
+            cut = rng.randint(1, len(word) - 1)
+            word = word[:cut] + rng.choice(["", " ", ":", "1"]) + word[cut:] if rng.random() < 0.5 else word[:cut]
+        else:
+            word = rng.choice(NOISE)
+        parts.append(word.upper() if rng.random() < 0.3 else word)
+    return "".join(parts)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_matches_legacy_loops(seed):
+    rng = random.Random(seed)
+    keyword_category.cache_clear()
+    for _ in range(5000):
+        name, obj_type, entity = random_text(rng), random_text(rng), rng.choice(ENTITIES)
+        assert classify(name, obj_type, entity) == legacy_classify(name, obj_type, entity), (name, obj_type, entity)
+
+@pytest.mark.parametrize('name, obj_type, entity', [
+    ("", "", "IfcWall"),
+    ("", "", "IfcFlowSegment"),
+    # Earlier categories win wherever their keyword is
+    ("Wall with duct opening", "", "IfcWall"),
+    ("Pipe", "Duct", "IfcFlowSegment"),
+    # Keywords across the Name / ObjectType boundary do not match
+    ("Pi", "pe", "IfcFlowSegment"),
+    ("Door:900x2100:348121", "Door:900x2100", "IfcWall"),
+    ("Basic Wall:Generic 200mm:348121", "Basic Wall:Generic 200mm", "IfcWallStandardCase"),
+    ("Basic Wall:Generic 200mm:348122", "Basic Wall:Generic 200mm", "IfcWallStandardCase"),
+    ("CURTAIN WALL", "", "IfcCurtainWall"),
+    ("Stair-Railing", "", "IfcRailing"),
+])
+def test_known_names(name, obj_type, entity):
+    assert classify(name, obj_type, entity) == legacy_classify(name, obj_type, entity)
@@ -0,0 +1,154 @@
+"""
+Conversion resume tests: stage markers across attempts and the conversion
+cache (restore, partial results, eviction).
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import io
+import os
+import sys
+from datetime import timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import convert
+from convert import (
+    CATEGORY_ARTIFACTS, ConversionStages, conversion_cache_path, evict_conversion_cache,
+    restore_cached_conversion, store_cached_conversion, stored_subsets
+)
+
+def test_stage_markers_survive_a_retry(minio, tmp_path):
+    stages = ConversionStages(minio, 'project', 'file')
+    assert stages.begin('key') == 1
+    stages.save('analysis.json', {'buckets': {'walls': [1, 2]}})
+    subset = tmp_path / 'walls.ifc'
+    subset.write_bytes(b'ISO-10303-21;')
+    stages.put_file('split/walls.ifc', str(subset))
+
+    # A retry, possibly on another worker, finds what the first attempt finished
+    retry = ConversionStages(minio, 'project', 'file')
+    assert retry.begin('key') == 2
+    assert retry.load('analysis.json') == {'buckets': {'walls': [1, 2]}}
+    assert retry.has('split/walls.ifc')
+    assert retry.load('tessellated/walls.json') is None
+
+    (cat, path), = stored_subsets(retry, ['walls'], str(tmp_path))
+    assert cat == 'walls'
+    assert open(path, 'rb').read() == b'ISO-10303-21;'
+
+def test_stages_of_another_ifc_are_dropped(minio):
+    stages = ConversionStages(minio, 'project', 'file')
+    stages.begin('key1')
+    stages.begin('key1')
+    stages.save('analysis.json', {})
+
+    # A new IFC uploaded under the same file starts over, attempts included
+    retry = ConversionStages(minio, 'project', 'file')
+    assert retry.begin('key2') == 1
+    assert not retry.has('analysis.json')
+    assert sorted(minio.objects) == ['project/file/_stages/job.json']
+
+def test_clear_drops_every_stage(minio):
+    stages = ConversionStages(minio, 'project', 'file')
+    stages.begin('key')
+    stages.save('uploaded/walls.json', {})
+    minio.put_json('project/file/walls.glb', {})
+
+    stages.clear()
+
+    assert list(minio.objects) == ['project/file/walls.glb']
+    assert not stages.has('uploaded/walls.json')
+
+def test_disabled_stages_store_nothing(minio):
+    stages = ConversionStages(minio, 'project', 'file', enabled=False)
+
+    assert stages.begin('key') is None
+    stages.save('analysis.json', {})
+    assert minio.objects == {}
+    assert stages.load('analysis.json') is None
+
+def converted_entry(project_id, file_id, category, element_count):
+    entry = {'category': category, 'element_count': element_count, 'fingerprint': f'{category}-digest'}
+    for field, extension in CATEGORY_ARTIFACTS:
+        entry[field] = f"{project_id}/{file_id}/{category}.{extension}"
+    return entry
+
+def upload_conversion(minio, project_id, file_id, categories):
+    """Artifacts of a finished conversion, returns its converted_files"""
+    converted_files = []
+    for category, element_count in categories.items():
+        entry = converted_entry(project_id, file_id, category, element_count)
+        for field, extension in CATEGORY_ARTIFACTS:
+            minio.put_json(entry[field], {'category': category, 'extension': extension})
+        converted_files.append(entry)
+    return converted_files
+
+def test_cached_conversion_restored_into_another_file(minio):
+    converted_files = upload_conversion(minio, 'p1', 'f1', {'walls': 3, 'pipes': 5})
+    store_cached_conversion(minio, 'key', converted_files)
+
+    restored = restore_cached_conversion(minio, 'key', 'p2', 'f2')
+
+    assert restored == [
+        converted_entry('p2', 'f2', 'walls', 3),
+        converted_entry('p2', 'f2', 'pipes', 5)
+    ]
+    for original, copy in zip(converted_files, restored):
+        for field, _ in CATEGORY_ARTIFACTS:
+            assert minio.objects[copy[field]] == minio.objects[original[field]]
+
+def test_missing_cache_entry_restores_nothing(minio):
+    assert restore_cached_conversion(minio, 'key', 'p', 'f') is None
+
+def test_entry_without_manifest_is_never_served(minio):
+    """A store that died before its manifest leaves artifacts that are not an entry"""
+    converted_files = upload_conversion(minio, 'p1', 'f1', {'walls': 3})
+    minio.copy_object(None, conversion_cache_path('key', 'walls.glb'),
+                      convert.CopySource(convert.MINIO_BUCKET, converted_files[0]['glb_path']))
+
+    assert restore_cached_conversion(minio, 'key', 'p2', 'f2') is None
+
+def cache_entry(minio, cache_key, size):
+    """Cache entry of `size` bytes of artifacts plus its manifest"""
+    minio.put_object(None, conversion_cache_path(cache_key, 'walls.glb'), io.BytesIO(bytes(size)), size)
+    minio.put_json(conversion_cache_path(cache_key, 'manifest.json'), {'converted_files': []})
+
+def cached_keys(minio):
+    prefix = f"{convert.CONVERSION_CACHE_PREFIX}/"
+    return sorted({name[len(prefix):].split('/')[0] for name in minio.objects if name.startswith(prefix)})
+
+def test_eviction_drops_least_recently_used_entries(minio, monkeypatch):
+    monkeypatch.setattr(convert, 'CONVERSION_CACHE_MAX_MB', 2)
+    monkeypatch.setattr(convert, 'CONVERSION_CACHE_MAX_AGE_DAYS', 0)
+    mb = 1024 * 1024
+    cache_entry(minio, 'a', mb // 2)
+    cache_entry(minio, 'b', mb // 2)
+    cache_entry(minio, 'c', mb // 2)
+    # Restoring 'a' rewrites its manifest, making it the most recently used
+    restore_cached_conversion(minio, 'a', 'p', 'f')
+    cache_entry(minio, 'd', mb)
+
+    evict_conversion_cache(minio)
+
+    assert cached_keys(minio) == ['a', 'd']
+
+class ClockAt:
+    """datetime stand-in whose now() is a fixed time"""
+    def __init__(self, now):
+        self._now = now
+
+    def now(self, tz=None):
+        return self._now
+
+def test_eviction_drops_entries_unused_for_too_long(minio, monkeypatch):
+    monkeypatch.setattr(convert, 'CONVERSION_CACHE_MAX_MB', 0)
+    monkeypatch.setattr(convert, 'CONVERSION_CACHE_MAX_AGE_DAYS', 30)
+    cache_entry(minio, 'old', 10)
+    minio.clock += timedelta(days=31)
+    cache_entry(minio, 'new', 10)
+    monkeypatch.setattr(convert, 'datetime', ClockAt(minio.clock))
+
+    evict_conversion_cache(minio)
+
+    assert cached_keys(minio) == ['new']
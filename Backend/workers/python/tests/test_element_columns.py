@@ -0,0 +1,108 @@
+"""
+Element columns tests: the .cols sidecar written by convert.py read back by
+clash_detection.py, from downloaded bytes and memory-mapped from a file.
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+import pytest
+from clash_detection import ElementColumns, ElementIndex
+from convert import write_element_columns
+
+ELEMENTS = {
+    '2O2Fr$t4X7Zf8NOew3FLOH': {
+        'GlobalId': '2O2Fr$t4X7Zf8NOew3FLOH', 'Name': 'Basic Wall:Generic 200mm:348121', 'IfcType': 'IfcWall',
+        'Level': 'Level 1', 'bbox': [0.0, 0.0, 0.0, 5.0, 0.2, 3.0], 'centroid': [2.5, 0.1, 1.5],
+        'Properties': {'FireRating': 'EI60'}
+    },
+    '1hOSvn6df7F8_7GcBWlRGQ': {
+        # Same type and level as the first one, interned once
+        'GlobalId': '1hOSvn6df7F8_7GcBWlRGQ', 'Name': 'Basic Wall:Generic 200mm:348122', 'IfcType': 'IfcWall',
+        'Level': 'Level 1', 'bbox': [5.0, 0.0, 0.0, 9.0, 0.2, 3.0]
+    },
+    '0Lt8gR_E9ESeGH5uY_g9e9': {
+        'GlobalId': '0Lt8gR_E9ESeGH5uY_g9e9', 'Name': 'Wärmedämmung «Außen» 日本', 'IfcType': 'IfcCovering',
+        'Level': '', 'centroid': [-1.0, 2.0, 3.5]
+    },
+    '3cUkl32yn9qRSPvBJVyWw5': {
+        # No name, no geometry, a malformed bbox
+        'GlobalId': '3cUkl32yn9qRSPvBJVyWw5', 'Name': None, 'IfcType': 'IfcBuildingElementProxy', 'bbox': [1.0, 2.0]
+    }
+}
+
+def expected_info(element):
+    """What a reader gets back for an element: its strings ('' when missing) and well-formed vectors"""
+    info = {key: element.get(key) or '' for key in ('GlobalId', 'Name', 'IfcType', 'Level')}
+    for key, size in (('bbox', 6), ('centroid', 3)):
+        if len(element.get(key) or []) == size:
+            info[key] = element[key]
+    return info
+
+@pytest.fixture(params=['bytes', 'memmap'])
+def read_columns(request, tmp_path):
+    """Write elements to a .cols file and open it the way the parametrized reader does"""
+    def read(elements):
+        path = tmp_path / 'walls.cols'
+        write_element_columns(elements, str(path))
+        if request.param == 'bytes':
+            return ElementColumns(path.read_bytes())
+        return ElementColumns(str(path))
+    return read
+
+def test_round_trip(read_columns):
+    columns = read_columns(ELEMENTS)
+
+    assert len(columns) == len(ELEMENTS)
+    assert list(columns) == list(ELEMENTS)
+    assert dict(columns.items()) == {global_id: expected_info(element) for global_id, element in ELEMENTS.items()}
+
+def test_round_trip_random(read_columns):
+    rng = np.random.default_rng(0)
+    elements = {}
+    for n in range(500):
+        global_id = f"{n:022d}"
+        element = {'GlobalId': global_id, 'Name': f"Element {rng.integers(20)}", 'IfcType': 'IfcPipeSegment'}
+        if rng.random() < 0.8:
+            element['bbox'] = rng.normal(size=6).tolist()
+        if rng.random() < 0.5:
+            element['centroid'] = rng.normal(size=3).tolist()
+        elements[global_id] = element
+
+    columns = read_columns(elements)
+
+    assert {global_id: columns[global_id] for global_id in elements} == {
+        global_id: expected_info(element) for global_id, element in elements.items()
+    }
+
+def test_empty_category(read_columns):
+    columns = read_columns({})
+
+    assert len(columns) == 0
+    assert list(columns) == []
+
+def test_columns_are_aligned(tmp_path):
+    path = tmp_path / 'walls.cols'
+    write_element_columns(ELEMENTS, str(path))
+    columns = ElementColumns(str(path))
+
+    for name, column in columns.columns.items():
+        assert column.ctypes.data % 64 == 0, name
+
+def test_not_a_columns_file():
+    with pytest.raises(ValueError):
+        ElementColumns(b'{"GlobalId": "not columns"}')
+
+def test_element_index_same_from_columns_and_dicts(read_columns):
+    from_columns = ElementIndex(read_columns(ELEMENTS))
+    from_dicts = ElementIndex({global_id: expected_info(element) for global_id, element in ELEMENTS.items()})
+
+    assert from_columns.ids == from_dicts.ids
+    assert from_columns.box_ids == from_dicts.box_ids
+    np.testing.assert_array_equal(from_columns.tree.data, from_dicts.tree.data)
+    np.testing.assert_array_equal(from_columns.box_min, from_dicts.box_min)
@@ -0,0 +1,76 @@
+"""
+Incremental conversion tests: entity digests and previous version lookup.
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import ifcopenshell
+import convert
+
+def placement_chain(depth, padding=0):
+    """IFC file with `depth` nested local placements, padding entities shift every STEP id"""
+    model = ifcopenshell.file(schema='IFC4')
+    for _ in range(padding):
+        model.createIfcCartesianPoint((9.0, 9.0, 9.0))
+    placement = model.createIfcLocalPlacement(None, model.createIfcAxis2Placement3D(
+        model.createIfcCartesianPoint((0.0, 0.0, 0.0))))
+    for i in range(depth):
+        placement = model.createIfcLocalPlacement(placement, model.createIfcAxis2Placement3D(
+            model.createIfcCartesianPoint((float(i), 0.0, 0.0))))
+    return model, placement
+
+def test_entity_digest_deeper_than_recursion_limit():
+    """A placement chain deeper than the recursion limit still gets a digest"""
+    _, placement = placement_chain(sys.getrecursionlimit() * 2)
+
+    assert len(convert.entity_digest(placement, {})) == 20
+
+def test_entity_digest_independent_of_step_ids():
+    _, placement1 = placement_chain(50)
+    _, placement2 = placement_chain(50, padding=7)
+    _, other = placement_chain(51)
+
+    assert convert.entity_digest(placement1, {}) == convert.entity_digest(placement2, {})
+    assert convert.entity_digest(placement1, {}) != convert.entity_digest(other, {})
+
+def test_entity_digest_memo_shared_across_calls():
+    model, placement = placement_chain(10)
+    memo = {}
+    digest = convert.entity_digest(placement, memo)
+
+    assert len(memo) == len(list(model))
+    assert convert.entity_digest(placement, memo) == digest
+
+def test_previous_version_by_lineage(monkeypatch):
+    """An upload naming its previous file is matched by id, never by file name"""
+    queries = []
+    def db_execute(query, values=None, fetchone=False):
+        queries.append((' '.join(query.split()), values))
+        return (json.dumps([{'category': 'walls'}]),)
+    monkeypatch.setattr(convert, 'db_execute', db_execute)
+
+    previous = convert.find_previous_version('project', 'new-file', 'model.ifc', 'old-file')
+
+    assert previous == [{'category': 'walls'}]
+    (query, values), = queries
+    assert 'WHERE id = %s AND project_id = %s' in query
+    assert 'original_name' not in query
+    assert values == ('old-file', 'project')
+
+def test_previous_version_by_name_without_lineage(monkeypatch):
+    queries = []
+    def db_execute(query, values=None, fetchone=False):
+        queries.append((' '.join(query.split()), values))
+        return None
+    monkeypatch.setattr(convert, 'db_execute', db_execute)
+
+    assert convert.find_previous_version('project', 'new-file', 'model.ifc') == []
+    (query, values), = queries
+    assert 'original_name = %s' in query
+    assert values == ('project', 'model.ifc', 'new-file')
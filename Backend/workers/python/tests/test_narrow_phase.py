@@ -0,0 +1,48 @@
+"""
+Narrow phase regression tests.
+
+Run from Backend/workers/python: python -m pytest tests
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+import pytest
+import trimesh
+from clash_detection import SharedGeometry, _narrow_phase_geometry, _narrow_phase_fcl_objects, narrow_phase_shard
+
+@pytest.fixture
+def geometry():
+    """Pack meshes as shared geometry under a test key, removed afterwards"""
+    keys = []
+
+    def pack(name, meshes, shapes):
+        key = ('test', name)
+        _narrow_phase_geometry[key] = SharedGeometry.pack(meshes, shapes)
+        keys.append(key)
+        return key
+
+    yield pack
+
+    for key in keys:
+        _narrow_phase_fcl_objects.pop(key, None)
+        _narrow_phase_geometry.pop(key).close(unlink=True)
+
+def test_overlapping_unit_cubes(geometry):
+    """Two unit cubes overlapping by 0.1 m: raw fcl.collide lists a depth-0 contact first on box/box"""
+    cube1 = trimesh.creation.box(extents=(1, 1, 1))
+    cube2 = trimesh.creation.box(extents=(1, 1, 1))
+    cube2.apply_translation((0.9, 0, 0))
+    key1 = geometry('cube1', [cube1], ['box'])
+    key2 = geometry('cube2', [cube2], ['box'])
+
+    hits, gaps, _, _ = narrow_phase_shard((key1, key2, np.array([[0, 0]]), np.array([True]), 0.05))
+
+    assert len(hits) == 1
+    assert gaps == []
+    idx1, idx2, penetration, _, _ = hits[0]
+    assert (idx1, idx2) == (0, 0)
+    assert penetration == pytest.approx(0.1, abs=1e-3)
@@ -0,0 +1,231 @@
+"""
+BIM Assistant - Shared Worker Plumbing
+Postgres connection pool, rate-limited status writes and the concurrent
+RabbitMQ job consumer used by the conversion and clash detection workers
+"""
+
+import os
+import time
+import functools
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+
+import psycopg2
+import psycopg2.pool
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+# Database Configuration
+DB_CONFIG = {
+    'host': os.getenv('DB_HOST', 'postgres'),
+    'port': int(os.getenv('DB_PORT', 5432)),
+    'database': os.getenv('DB_NAME', 'bim_assistant'),
+    'user': os.getenv('DB_USER', 'bim_user'),
+    'password': os.getenv('DB_PASSWORD', 'bim_password')
+}
+
+# Postgres connections shared by status updates and result writes
+DB_POOL_MAX = int(os.getenv('DB_POOL_MAX', 4))
+# Progress updates of one job closer together than this are coalesced (ms)
+STATUS_UPDATE_INTERVAL_MS = int(os.getenv('STATUS_UPDATE_INTERVAL_MS', 1000))
+
+# ============================================================================
+# DATABASE
+# ============================================================================
+
+_db_pool = None
+_db_pool_lock = threading.Lock()
+_db_pool_size = DB_POOL_MAX
+
+def reserve_db_connections(count):
+    """Grow the pool to at least count connections, called by a worker before its first query"""
+    global _db_pool_size
+    with _db_pool_lock:
+        _db_pool_size = max(_db_pool_size, count)
+
+def get_db_pool():
+    """Connection pool shared by every thread of this worker, created on first use"""
+    global _db_pool
+    with _db_pool_lock:
+        if _db_pool is None:
+            # An exhausted pool raises instead of waiting, so workers reserve a
+            # connection per concurrent job plus one for status writes
+            _db_pool = psycopg2.pool.ThreadedConnectionPool(1, _db_pool_size, **DB_CONFIG)
+        return _db_pool
+
+@contextmanager
+def pooled_connection():
+    """Pooled connection, committed on success; a broken connection is closed instead of returned"""
+    pool = get_db_pool()
+    conn = pool.getconn()
+    broken = False
+    try:
+        yield conn
+        conn.commit()
+    except (psycopg2.OperationalError, psycopg2.InterfaceError):
+        broken = True
+        raise
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        pool.putconn(conn, close=broken or bool(conn.closed))
+
+def acquire_connection():
+    """
+    Pooled connection held for a whole job, checked alive first and replaced
+    once if it was dropped. Hand it back with release_connection.
+    """
+    pool = get_db_pool()
+    for attempt in (1, 2):
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.rollback()
+            return conn
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            pool.putconn(conn, close=True)
+            if attempt == 2:
+                raise
+            print(f"[WARNING] Database connection lost ({e}), reconnecting")
+
+def release_connection(conn):
+    """Give a job connection back to the pool, uncommitted work is rolled back"""
+    broken = bool(conn.closed)
+    if not broken:
+        try:
+            conn.rollback()
+        except (psycopg2.OperationalError, psycopg2.InterfaceError):
+            broken = True
+    get_db_pool().putconn(conn, close=broken)
+
+def db_execute(query, values=None, fetchone=False):
+    """Run one statement on a pooled connection, retried once on a new connection if the pooled one was dead"""
+    for attempt in (1, 2):
+        try:
+            with pooled_connection() as conn, conn.cursor() as cursor:
+                cursor.execute(query, values)
+                return cursor.fetchone() if fetchone else None
+        except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+            if attempt == 2:
+                raise
+            print(f"[WARNING] Database connection lost ({e}), reconnecting")
+
+# ============================================================================
+# STATUS UPDATES
+# ============================================================================
+
+class StatusThrottle:
+    """
+    At most one progress write per job every interval seconds. Skipped
+    updates are coalesced (latest wins) and written when the interval ends;
+    forced updates (final statuses) are written at once and drop any pending one.
+    Writes of one job are serialized by a lock of that job only, so a slow
+    write never holds up the status updates of other jobs.
+    """
+    def __init__(self, interval, write):
+        self.interval = interval
+        self.write = write
+        self.lock = threading.Lock()
+        self.job_locks = {}
+        # Per-job entries, only touched while holding that job's lock
+        self.last_write = {}
+        self.pending = {}
+        self.timers = {}
+    
+    def job_lock(self, job_id):
+        with self.lock:
+            return self.job_locks.setdefault(job_id, threading.Lock())
+    
+    def submit(self, job_id, args, force=False):
+        with self.job_lock(job_id):
+            timer = self.timers.pop(job_id, None)
+            if timer is not None:
+                timer.cancel()
+            self.pending.pop(job_id, None)
+            
+            wait = self.last_write.get(job_id, float('-inf')) + self.interval - time.monotonic()
+            if force or wait <= 0:
+                self._write(job_id, args)
+                if force:
+                    self.last_write.pop(job_id, None)
+                    with self.lock:
+                        self.job_locks.pop(job_id, None)
+                return
+            
+            self.pending[job_id] = args
+            timer = self.timers[job_id] = threading.Timer(wait, self.flush)
+            timer.args = (job_id, timer)
+            timer.daemon = True
+            timer.start()
+    
+    def flush(self, job_id, timer):
+        with self.lock:
+            lock = self.job_locks.get(job_id)
+        if lock is None:
+            return  # A final status was written since the timer fired
+        with lock:
+            # A newer update cancelled this timer while it waited for the lock
+            if self.timers.get(job_id) is not timer:
+                return
+            del self.timers[job_id]
+            self._write(job_id, self.pending.pop(job_id))
+    
+    def _write(self, job_id, args):
+        # Under the job's lock, so a late flush can never land after a newer update
+        self.last_write[job_id] = time.monotonic()
+        self.write(*args)
+
+# ============================================================================
+# RABBITMQ CONSUMER
+# ============================================================================
+
+class JobConsumer:
+    """
+    Runs up to `concurrency` jobs on a thread pool while the connection thread
+    keeps receiving messages and heartbeats. pika channels are not thread-safe,
+    so acks are handed back to the connection thread. handle(body) returns
+    'ack', 'reject' or 'requeue'.
+    """
+    def __init__(self, handle, concurrency):
+        self.handle = handle
+        self.executor = ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='job')
+        self.in_flight = set()
+        self.draining = False
+    
+    def on_message(self, connection, channel, method, properties, body):
+        future = self.executor.submit(self.run, connection, channel, method.delivery_tag, body)
+        self.in_flight.add(future)
+        future.add_done_callback(self.in_flight.discard)
+    
+    def run(self, connection, channel, delivery_tag, body):
+        # Prefetched messages not started before shutdown go back to the queue
+        outcome = 'requeue' if self.draining else self.handle(body)
+        try:
+            connection.add_callback_threadsafe(functools.partial(self.settle, channel, delivery_tag, outcome))
+        except Exception as e:
+            print(f"[WARNING] Could not settle message, connection closed (it will be redelivered): {e}")
+    
+    def settle(self, channel, delivery_tag, outcome):
+        if not channel.is_open:
+            return
+        if outcome == 'ack':
+            channel.basic_ack(delivery_tag=delivery_tag)
+        else:
+            channel.basic_nack(delivery_tag=delivery_tag, requeue=outcome == 'requeue')
+    
+    def drain(self, connection):
+        """Finish the running jobs, pumping the connection so their acks still go out"""
+        self.draining = True
+        if self.in_flight:
+            print(f"Waiting for {len(self.in_flight)} job(s) to finish...")
+        while self.in_flight and connection.is_open:
+            connection.process_data_events(time_limit=1)
+        # Acks of the last jobs were queued just before they finished
+        if connection.is_open:
+            connection.process_data_events(time_limit=0)
+        self.executor.shutdown(wait=True)
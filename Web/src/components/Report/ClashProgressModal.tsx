@@ -15,7 +15,8 @@ const ClashProgressModal: React.FC<ClashProgressModalProps> = ({
   onComplete,
   onClose,
 }) => {
-  const { progress, status, message, error, isComplete, isFailed } = useClashProgress(reportId);
+  const { progress, status, message, error, isComplete, isFailed, totalClashes, criticalClashes } =
+    useClashProgress(reportId);
 
   useEffect(() => {
     if (isComplete) {
@@ -75,6 +76,15 @@ const ClashProgressModal: React.FC<ClashProgressModalProps> = ({
             )}
           </div>
 
+          {!isComplete && !isFailed && totalClashes > 0 && (
+            <div className="progress-message">
+              <p>
+                {totalClashes} clashes found so far ({criticalClashes} critical).
+                Close this window to review them while detection continues.
+              </p>
+            </div>
+          )}
+
           {isComplete && (
             <div className="success-message">
               <p>Clash detection completed successfully!</p>
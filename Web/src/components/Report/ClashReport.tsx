@@ -1,4 +1,5 @@
-import React, { useState, useMemo } from "react";
+import React, { useState, useMemo, useEffect } from "react";
+import api from "../../services/api";
 import "./ClashReport.css";
 
 interface SampleElement {
@@ -43,86 +44,109 @@ interface ClashReportData {
   criticalClashes: number;
   majorClashes: number;
   minorClashes: number;
-  clashesData?: Clash[];
   createdAt: string;
 }
 
 interface ClashReportProps {
   report: ClashReportData | null;
+  // Categories of the project's models, offered in the category filter
+  categories?: string[];
   onClashClick?: (clash: Clash) => void;
 }
 
 type SortBy = "severity" | "penetration" | "id";
 
-const ClashReport: React.FC<ClashReportProps> = ({ report, onClashClick }) => {
+// Clashes loaded per page from GET /reports/:reportId/clashes (the API allows up to 100)
+const CLASH_PAGE_SIZE = 100;
+
+const sortClashes = (clashes: Clash[], sortBy: SortBy): Clash[] => {
+  const sorted = [...clashes];
+
+  switch (sortBy) {
+    case "severity": {
+      const severityOrder = { critical: 0, major: 1, minor: 2 };
+      sorted.sort(
+        (a, b) =>
+          (severityOrder[a.severity as keyof typeof severityOrder] ?? 3) -
+          (severityOrder[b.severity as keyof typeof severityOrder] ?? 3),
+      );
+      break;
+    }
+    case "penetration":
+      sorted.sort((a, b) => b.penetration_depth - a.penetration_depth);
+      break;
+    case "id":
+      sorted.sort((a, b) => a.clash_id - b.clash_id);
+      break;
+  }
+
+  return sorted;
+};
+
+const ClashReport: React.FC<ClashReportProps> = ({
+  report,
+  categories = [],
+  onClashClick,
+}) => {
   // ALL HOOKS AT TOP
   const [selectedSeverity, setSelectedSeverity] = useState<string>("all");
   const [selectedCategory, setSelectedCategory] = useState<string>("all");
   const [sortBy, setSortBy] = useState<SortBy>("severity");
   const [expandedClash, setExpandedClash] = useState<number | null>(null);
   const [copiedId, setCopiedId] = useState<number | null>(null);
+  const [page, setPage] = useState(1);
+  const [clashes, setClashes] = useState<Clash[]>([]);
+  const [matchingClashes, setMatchingClashes] = useState(0);
+  const [totalPages, setTotalPages] = useState(0);
 
-  // Memoized clashes and categories
-  const clashes = useMemo(
-    () => report?.clashesData || [],
-    [report?.clashesData],
-  );
+  // A new report starts on its first page
+  useEffect(() => {
+    setPage(1);
+  }, [report?.id]);
 
-  const categories = useMemo(() => {
-    return Array.from(
-      new Set(
-        clashes.flatMap((c) =>
-          [
-            c.object1?.category || c.object1_category,
-            c.object2?.category || c.object2_category,
-          ].filter(Boolean),
-        ),
-      ),
-    ).sort() as string[];
-  }, [clashes]);
-
-  // Filter clashes
-  const filteredClashes = useMemo(() => {
-    console.log(clashes);
-    return clashes.filter((clash) => {
-      if (selectedSeverity !== "all" && clash.severity !== selectedSeverity) {
-        return false;
-      }
-      if (selectedCategory !== "all") {
-        const cat1 = clash.object1?.category || clash.object1_category || "";
-        const cat2 = clash.object2?.category || clash.object2_category || "";
-        if (cat1 !== selectedCategory && cat2 !== selectedCategory) {
-          return false;
-        }
-      }
-      return true;
-    });
-  }, [clashes, selectedSeverity, selectedCategory]);
-
-  // Sort clashes
-  const sortedClashes = useMemo(() => {
-    const sorted = [...filteredClashes];
-
-    switch (sortBy) {
-      case "severity": {
-        const severityOrder = { critical: 0, major: 1, minor: 2 };
-        sorted.sort(
-          (a, b) =>
-            (severityOrder[a.severity as keyof typeof severityOrder] ?? 3) -
-            (severityOrder[b.severity as keyof typeof severityOrder] ?? 3),
-        );
-        break;
-      }
-      case "penetration":
-        sorted.sort((a, b) => b.penetration_depth - a.penetration_depth);
-        break;
-      case "id":
-        sorted.sort((a, b) => a.clash_id - b.clash_id);
-        break;
-    }
+  // Load the current page, filtered by the API; reloaded whenever the counts
+  // show new clashes were stored
+  const reportId = report?.id;
+  const reportStatus = report?.status;
+  const totalClashes = report?.totalClashes;
+  useEffect(() => {
+    if (!reportId || reportStatus === "failed") return;
+
+    let cancelled = false;
+    const params: Record<string, string | number> = {
+      page,
+      limit: CLASH_PAGE_SIZE,
+    };
+    if (selectedSeverity !== "all") params.severity = selectedSeverity;
+    if (selectedCategory !== "all") params.category = selectedCategory;
 
-    return sorted;
-  }, [filteredClashes, sortBy]);
+    api
+      .get(`reports/${reportId}/clashes`, { params })
+      .then((response) => {
+        if (cancelled) return;
+        setClashes(response.data.data.clashes);
+        setMatchingClashes(response.data.data.pagination.total);
+        setTotalPages(response.data.data.pagination.totalPages);
+      })
+      .catch((error) => console.error("Failed to fetch clashes:", error));
+
+    return () => {
+      cancelled = true;
+    };
+  }, [
+    reportId,
+    reportStatus,
+    totalClashes,
+    page,
+    selectedSeverity,
+    selectedCategory,
+  ]);
+
+  // Sort clashes of the current page
+  const sortedClashes = useMemo(
+    () => sortClashes(clashes, sortBy),
+    [clashes, sortBy],
+  );
 
   // Helper: Get color for severity badge
   const getSeverityColor = (severity: string): string => {
@@ -151,12 +175,36 @@ const ClashReport: React.FC<ClashReportProps> = ({ report, onClashClick }) => {
     setTimeout(() => setCopiedId(null), 2000);
   };
 
-  // Helper: Export clashes to CSV
-  const exportToCSV = () => {
+  // Helper: Export clashes to CSV, every clash matching the filters (not just
+  // the loaded page) read from the report download
+  const exportToCSV = async () => {
+    let allClashes: Clash[];
+    try {
+      const response = await api.get(`reports/${report?.id}/download`);
+      allClashes = response.data.clashes;
+    } catch (error) {
+      console.error("Failed to download clashes:", error);
+      return;
+    }
+
+    const filteredClashes = allClashes.filter((clash) => {
+      if (selectedSeverity !== "all" && clash.severity !== selectedSeverity) {
+        return false;
+      }
+      if (selectedCategory !== "all") {
+        const cat1 = clash.object1?.category || clash.object1_category || "";
+        const cat2 = clash.object2?.category || clash.object2_category || "";
+        if (cat1 !== selectedCategory && cat2 !== selectedCategory) {
+          return false;
+        }
+      }
+      return true;
+    });
+
     let csv =
       "Clash ID,Severity,Penetration (cm),Clearance (cm),Object 1,Object 2,Position X,Position Y,Position Z\n";
 
-    sortedClashes.forEach((clash) => {
+    sortClashes(filteredClashes, sortBy).forEach((clash) => {
       const obj1 = clash.object1?.category || clash.object1_category || "N/A";
       const obj2 = clash.object2?.category || clash.object2_category || "N/A";
       const pos = clash.position || {
@@ -244,10 +292,13 @@ const ClashReport: React.FC<ClashReportProps> = ({ report, onClashClick }) => {
           <label>Severity:</label>
           <select
             value={selectedSeverity}
-            onChange={(e) => setSelectedSeverity(e.target.value)}
+            onChange={(e) => {
+              setSelectedSeverity(e.target.value);
+              setPage(1);
+            }}
             className="filter-select"
           >
-            <option value="all">All ({clashes.length})</option>
+            <option value="all">All ({report.totalClashes})</option>
             <option value="critical">
               Critical ({report.criticalClashes})
             </option>
@@ -260,7 +311,10 @@ const ClashReport: React.FC<ClashReportProps> = ({ report, onClashClick }) => {
           <label>Category:</label>
           <select
             value={selectedCategory}
-            onChange={(e) => setSelectedCategory(e.target.value)}
+            onChange={(e) => {
+              setSelectedCategory(e.target.value);
+              setPage(1);
+            }}
             className="filter-select"
           >
             <option value="all">All Categories</option>
@@ -421,6 +475,28 @@ const ClashReport: React.FC<ClashReportProps> = ({ report, onClashClick }) => {
           ))
         )}
       </div>
+
+      {totalPages > 1 && (
+        <div className="clash-pagination">
+          <button
+            className="page-btn"
+            disabled={page <= 1}
+            onClick={() => setPage(page - 1)}
+          >
+            ‹ Prev
+          </button>
+          <span className="page-info">
+            Page {page} of {totalPages} ({matchingClashes} clashes)
+          </span>
+          <button
+            className="page-btn"
+            disabled={page >= totalPages}
+            onClick={() => setPage(page + 1)}
+          >
+            Next ›
+          </button>
+        </div>
+      )}
     </div>
   );
 };
@@ -7,6 +7,8 @@ interface ClashProgressData {
   progress: number;
   message?: string;
   error?: string;
+  totalClashes?: number;
+  criticalClashes?: number;
 }
 
 interface UseClashProgressReturn {
@@ -16,6 +18,8 @@ interface UseClashProgressReturn {
   error: string | null;
   isComplete: boolean;
   isFailed: boolean;
+  totalClashes: number;
+  criticalClashes: number;
 }
 
 export const useClashProgress = (reportId: string | null): UseClashProgressReturn => {
@@ -25,6 +29,9 @@ export const useClashProgress = (reportId: string | null): UseClashProgressRetur
   const [error, setError] = useState<string | null>(null);
   const [isComplete, setIsComplete] = useState<boolean>(false);
   const [isFailed, setIsFailed] = useState<boolean>(false);
+  // Clashes of the category pairs finished so far, stored as detection runs
+  const [totalClashes, setTotalClashes] = useState<number>(0);
+  const [criticalClashes, setCriticalClashes] = useState<number>(0);
 
   useEffect(() => {
     if (!reportId) return;
@@ -61,6 +68,8 @@ export const useClashProgress = (reportId: string | null): UseClashProgressRetur
           setProgress(data.progress || 0);
           setStatus(data.status || 'processing');
           setMessage(data.message || 'Processing...');
+          setTotalClashes(data.totalClashes || 0);
+          setCriticalClashes(data.criticalClashes || 0);
         }
 
         if (data.type === 'done') {
@@ -104,5 +113,7 @@ export const useClashProgress = (reportId: string | null): UseClashProgressRetur
     error,
     isComplete,
     isFailed,
+    totalClashes,
+    criticalClashes,
   };
 };
@@ -71,10 +71,12 @@ interface ClashReportData {
   criticalClashes: number;
   majorClashes: number;
   minorClashes: number;
-  clashesData: Clash[];
   createdAt: string;
 }
 
+// How often the counts of a running report are polled once the progress window is closed
+const REPORT_POLL_INTERVAL_MS = 5000;
+
 const ProjectViewPage = () => {
   const { projectId } = useParams<{ projectId: string }>();
   const canvasRef = useRef<Canvas3DHandle>(null);
@@ -171,6 +173,11 @@ const ProjectViewPage = () => {
     }));
   }, [project?.files]);
 
+  const clashCategories = useMemo(
+    () => availableCategories.map((category) => category.name).sort(),
+    [availableCategories],
+  );
+
   // Memoized models from project
   const models = useMemo(() => {
     if (!project?.files || project.files.length === 0) return [];
@@ -228,19 +235,30 @@ const ProjectViewPage = () => {
     setSelectedClash(clash);
   }, []);
 
-  const handleClashPointClickOnCanvas = useCallback(
-    (clashId: number) => {
-      if (clashReport && clashReport.clashesData) {
-        const clash = clashReport.clashesData.find(
-          (c) => c.clash_id === clashId,
-        );
-        if (clash) {
-          setSelectedClash(clash);
-        }
+  // Only the selected clash is drawn (the report's clashes are loaded a page
+  // at a time), so a click on its point keeps it selected
+  const handleClashPointClickOnCanvas = useCallback((clashId: number) => {
+    setSelectedClash((current) =>
+      current && current.clash_id === clashId ? current : null,
+    );
+  }, []);
+
+  const fetchLatestClashReport = useCallback(async () => {
+    try {
+      const response = await api.get(`reports/project/${projectId}`);
+      if (response.data.success && response.data.data.reports.length > 0) {
+        // The list only has summaries, load the details of the most recent report
+        const reportResponse = await api.get(`reports/${response.data.data.reports[0].id}`);
+        const latestReport = reportResponse.data.data.report;
+        setClashReport(latestReport);
+        console.log("Fetched clash reports:", response.data.data.reports);
+
+        console.log("Latest clash report:", latestReport);
       }
-    },
-    [clashReport],
-  );
+    } catch (error) {
+      console.error("Failed to fetch clash reports:", error);
+    }
+  }, [projectId]);
 
   useEffect(() => {
     const fetchProject = async () => {
@@ -259,7 +277,7 @@ const ProjectViewPage = () => {
     };
 
     fetchProject();
-  }, [projectId]);
+  }, [projectId, fetchLatestClashReport]);
 
   // const handleClashClick = useCallback((clash: unknown) => {
   //   // Focus camera on the clash position
@@ -284,23 +302,40 @@ const ProjectViewPage = () => {
     };
 
     fetchProject();
-  }, [projectId]);
-
-  const fetchLatestClashReport = async () => {
-    try {
-      const response = await api.get(`reports/project/${projectId}`);
-      if (response.data.success && response.data.data.reports.length > 0) {
-        // Get the most recent report
-        const latestReport = response.data.data.reports[0];
-        setClashReport(latestReport);
-        console.log("Fetched clash reports:", response.data.data.reports);
+  }, [projectId, fetchLatestClashReport]);
+
+  // After the progress window is closed, keep polling the counts while detection
+  // runs (the clash list reloads its page when they change); the poll that sees
+  // it finish loads the final report
+  const runningReportId =
+    clashReport &&
+    (clashReport.status === "pending" || clashReport.status === "processing")
+      ? clashReport.id
+      : null;
+  useEffect(() => {
+    if (clashReportId || !runningReportId) return;
 
-        console.log("Latest clash report:", latestReport);
+    const timer = setInterval(async () => {
+      try {
+        const response = await api.get(
+          `reports/${runningReportId}/statistics`,
+        );
+        const { statistics, status } = response.data.data;
+        if (status !== "pending" && status !== "processing") {
+          await fetchLatestClashReport();
+          return;
+        }
+        setClashReport((current) =>
+          current && current.id === runningReportId
+            ? { ...current, ...statistics, status }
+            : current,
+        );
+      } catch (error) {
+        console.error("Failed to poll clash report:", error);
       }
-    } catch (error) {
-      console.error("Failed to fetch clash reports:", error);
-    }
-  };
+    }, REPORT_POLL_INTERVAL_MS);
+    return () => clearInterval(timer);
+  }, [clashReportId, runningReportId, fetchLatestClashReport]);
 
   const handleRunClashDetection = async () => {
     if (!project?.files) {
@@ -354,9 +389,12 @@ const ProjectViewPage = () => {
     await fetchLatestClashReport();
   };
 
-  const handleCloseProgress = () => {
+  const handleCloseProgress = async () => {
     setIsRunningClash(false);
     setClashReportId(null);
+
+    // Clashes of the category pairs finished so far are already stored
+    await fetchLatestClashReport();
   };
 
   const handleResetView = () => {
@@ -414,7 +452,11 @@ const ProjectViewPage = () => {
             selectedClashId={selectedClash?.clash_id}
           />
 
-          <ClashReport report={clashReport} onClashClick={handleClashClick} />
+          <ClashReport
+            report={clashReport}
+            categories={clashCategories}
+            onClashClick={handleClashClick}
+          />
         </div>
 
         {clashReportId && (